@@ -2,8 +2,13 @@
 Common constants for file readers.
 """
 
-# Common encoding options to try when reading files
-COMMON_ENCODINGS = [
+import sys
+
+# Common encoding options to try when reading files.
+# Immutable tuple of interned names: the trial loops iterate these on every
+# read, and interning lets pandas' internal string comparisons short-circuit
+# on identity.
+COMMON_ENCODINGS = tuple(sys.intern(encoding) for encoding in (
     "utf-8",         # Most common encoding, compatible with ASCII
     "utf-8-sig",     # UTF-8 with BOM (Byte Order Mark)
     "cp1252",        # Windows-1252, Western European
@@ -27,10 +32,10 @@ COMMON_ENCODINGS = [
     "gb2312",        # Simplified Chinese
     "mac_roman",     # Old Mac OS Western
     "ascii",         # Basic 7-bit encoding
-]
+))
 
 # Common delimiters used in delimited text files
-COMMON_DELIMITERS = [
+COMMON_DELIMITERS = (
     ",",             # Comma (most common)
     ";",             # Semicolon (European CSVs)
     "\t",            # Tab (TSV files)
@@ -48,7 +53,7 @@ COMMON_DELIMITERS = [
     "=",             # Equals
     "'",             # Single quote
     "\"",            # Double quote
-]
+)
 
 # Excel engines to try based on file format
 EXCEL_ENGINES = {
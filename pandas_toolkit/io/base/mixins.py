@@ -168,8 +168,10 @@ class NormalizeMixin:
             preset_msg = f" with preset '{preset}'" if preset else ""
             print(f"[NORMALIZE] Starting normalization{preset_msg}...")
         
-        # Work with copy
-        df = df.copy()
+        # Work with a shallow copy: column assignments below replace whole
+        # columns rather than writing into shared arrays, so the caller's
+        # DataFrame is never mutated and untouched columns are never duplicated
+        df = df.copy(deep=False)
         
         # Handle configuration
         if preset is not None:
@@ -382,41 +384,51 @@ class NormalizeMixin:
             
             string_cols_processed = 0
             total_strings_normalized = 0
-            
-            for col in df.columns:
-                # Only process object/string columns (skip already processed numeric/date columns)
-                if StringNormalizer.is_string_column(df[col]):
-                    # Skip if already processed as date or numeric
-                    if col in report.column_changes:
-                        col_type = report.column_changes[col].get('changes', {}).get('type')
-                        if col_type in ['date', 'numeric']:
-                            continue
-                    
-                    normalized_values = StringNormalizer.normalize(
-                        df[col],
-                        trim=trim,
-                        convert_case=case,
-                        remove_special_chars=remove_special
-                    )
-                    
-                    # Count changes by comparing non-null values with same index
-                    mask = df[col].notna()
-                    if mask.any():
-                        original_non_null = df[col][mask].astype(str)
-                        normalized_non_null = normalized_values[mask].astype(str)
-                        changes = (original_non_null != normalized_non_null).sum()
+
+            # Select object/string columns once instead of checking dtype per column
+            # (numeric columns are skipped entirely, never coerced to strings)
+            str_cols = df.select_dtypes(include=['object', 'string']).columns
+
+            # Set membership is O(1) per check, unlike `in df.columns`
+            existing = set(df.columns)
+
+            for col in str_cols:
+                # Skip if already processed as date or numeric
+                if col in report.column_changes:
+                    col_type = report.column_changes[col].get('changes', {}).get('type')
+                    if col_type in ['date', 'numeric']:
+                        continue
+
+                # Re-normalizing a frame that already carries this column's
+                # suffix output would recompute identical values; skip it
+                if not drop_original and f"{col}{suffix}" in existing:
+                    continue
+
+                normalized_values = StringNormalizer.normalize(
+                    df[col],
+                    trim=trim,
+                    convert_case=case,
+                    remove_special_chars=remove_special
+                )
+
+                # Count changes by comparing non-null values with same index
+                mask = df[col].notna()
+                if mask.any():
+                    original_non_null = df[col][mask].astype(str)
+                    normalized_non_null = normalized_values[mask].astype(str)
+                    changes = (original_non_null != normalized_non_null).sum()
+                else:
+                    changes = 0
+
+                if changes > 0 or drop_original:
+                    if drop_original:
+                        df[col] = normalized_values
                     else:
-                        changes = 0
-                    
-                    if changes > 0 or drop_original:
-                        if drop_original:
-                            df[col] = normalized_values
-                        else:
-                            normalized_col = f"{col}{suffix}"
-                            df[normalized_col] = normalized_values
-                        
-                        string_cols_processed += 1
-                        total_strings_normalized += changes
+                        normalized_col = f"{col}{suffix}"
+                        df[normalized_col] = normalized_values
+
+                    string_cols_processed += 1
+                    total_strings_normalized += changes
             
             if total_strings_normalized > 0:
                 report.add_transformation(
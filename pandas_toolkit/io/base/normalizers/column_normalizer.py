@@ -5,12 +5,64 @@ Provides specialized functionality for cleaning and standardizing DataFrame
 column names.
 """
 
+import numpy as np
 import pandas as pd
 import re
 import unicodedata
-from collections import defaultdict
+from functools import lru_cache
 from typing import List
 
+# Precompiled pattern for collapsing runs of non-word characters
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+
+def _build_accent_table() -> dict:
+    """
+    Build a translation table mapping accented Latin codepoints to their
+    base characters (Latin-1 Supplement and Latin Extended-A/B).
+
+    Precomputing the NFD decomposition once lets str.translate strip
+    accents in a single C-level pass instead of decomposing per call.
+    """
+    table = {}
+    for codepoint in range(0x00C0, 0x0250):
+        char = chr(codepoint)
+        decomposed = unicodedata.normalize('NFD', char)
+        stripped = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+        if stripped != char:
+            table[codepoint] = stripped
+    return table
+
+
+_ACCENT_TABLE = str.maketrans(_build_accent_table())
+
+
+@lru_cache(maxsize=1024)
+def _remove_accents_cached(text: str) -> str:
+    """
+    Accent removal for non-ASCII text, memoized.
+
+    Column-name vocabularies repeat heavily across files (headers of
+    partitioned CSVs), so caching turns repeated decompositions into
+    dictionary lookups. Bounded at 1024 entries.
+    """
+    # Fast path: one C-level table lookup per character covers the
+    # common Latin accented codepoints
+    translated = text.translate(_ACCENT_TABLE)
+    if translated.isascii():
+        return translated
+
+    # Fall back to full NFD decomposition for anything outside the table.
+    # Decomposition (not NFC/NFKC) is required so combining marks become
+    # separate codepoints that the category filter can strip; the
+    # quick-check skips the normalization pass for already-decomposed
+    # input, which many upstream systems emit.
+    if unicodedata.is_normalized('NFD', translated):
+        nfd = translated
+    else:
+        nfd = unicodedata.normalize('NFD', translated)
+    return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+
 
 class ColumnNormalizer:
     """
@@ -66,41 +118,39 @@ class ColumnNormalizer:
         >>> print(normalized.columns.tolist())
         ['first_name', 'last_name', 'employee_id']
         """
-        # Create a copy to avoid modifying original
-        df = df.copy()
-        
-        # Step 1: Clean each column name
-        cleaned_cols = []
-        for col in df.columns:
-            if pd.isna(col) or col == "":
-                cleaned = empty_col_name
-            else:
-                # Convert to string
-                col_str = str(col).strip()
-                
-                # Remove accents
-                col_str = ColumnNormalizer._remove_accents(col_str)
-                
-                # Convert case
-                if convert_case == "lower":
-                    col_str = col_str.lower()
-                elif convert_case == "upper":
-                    col_str = col_str.upper()
-                
-                # Replace special chars and spaces with underscore
-                if remove_special_chars:
-                    col_str = re.sub(r'[^\w]+', '_', col_str)
-                    # Remove leading/trailing underscores
-                    col_str = col_str.strip('_')
-                else:
-                    # Only replace spaces
-                    col_str = col_str.replace(' ', '_')
-                
-                # Replace empty with default name
-                cleaned = col_str if col_str else empty_col_name
-            
-            cleaned_cols.append(cleaned)
-        
+        # Shallow copy: only the columns Index is replaced, data arrays are
+        # shared with the original (copy-on-write protects the caller)
+        df = df.copy(deep=False)
+
+        # Step 1: Clean all column names in one vectorized pipeline
+        raw = pd.Series(list(df.columns), dtype='object')
+        names = raw.astype(str).str.strip()
+
+        # Missing/empty names get the default name at the end
+        empty_mask = raw.isna() | names.eq('')
+        names = names.fillna('')
+
+        # Remove accents (only names that aren't pure ASCII need it)
+        non_ascii = ~names.map(str.isascii)
+        if non_ascii.any():
+            names[non_ascii] = names[non_ascii].map(ColumnNormalizer._remove_accents)
+
+        # Convert case
+        if convert_case == "lower":
+            names = names.str.lower()
+        elif convert_case == "upper":
+            names = names.str.upper()
+
+        # Replace special chars and spaces with underscore
+        if remove_special_chars:
+            names = names.str.replace(_NON_WORD_RE, '_', regex=True).str.strip('_')
+        else:
+            # Only replace spaces
+            names = names.str.replace(' ', '_', regex=False)
+
+        # Replace empty with default name
+        cleaned_cols = names.where(~empty_mask & names.ne(''), empty_col_name).tolist()
+
         # Step 2: Handle duplicates
         final_cols = ColumnNormalizer._handle_duplicate_columns(cleaned_cols, empty_col_name)
         
@@ -129,8 +179,11 @@ class ColumnNormalizer:
         >>> ColumnNormalizer._remove_accents("Português")
         'Portugues'
         """
-        nfd = unicodedata.normalize('NFD', text)
-        return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+        if text.isascii():
+            # ASCII needs no work and would only churn the cache
+            return text
+
+        return _remove_accents_cached(text)
     
     @staticmethod
     def _handle_duplicate_columns(cols: List[str], empty_name: str = "unnamed") -> List[str]:
@@ -155,14 +208,13 @@ class ColumnNormalizer:
         >>> ColumnNormalizer._handle_duplicate_columns(cols)
         ['name', 'name_1', 'age', 'age_1']
         """
-        counter = defaultdict(int)
-        result = []
-        
-        for col in cols:
-            if counter[col] == 0:
-                result.append(col)
-            else:
-                result.append(f"{col}_{counter[col]}")
-            counter[col] += 1
-        
-        return result
+        if len(set(cols)) == len(cols):
+            # No duplicates — skip the groupby machinery entirely
+            return list(cols)
+
+        # Vectorized: occurrence index per name via groupby cumcount,
+        # then append the suffix only where the index is non-zero
+        s = pd.Series(cols, dtype='object')
+        n = s.groupby(s, sort=False).cumcount()
+        result = np.where(n == 0, s, s + '_' + n.astype(str))
+        return result.tolist()
@@ -73,9 +73,11 @@ class StringNormalizer:
             result = result.str.replace(r'\s+', ' ', regex=True)
             result = result.str.strip()
         
-        # Convert empty strings to None
-        result = result.replace('', None)
-        result = result.replace('nan', None)
+        # Convert empty strings and 'nan' sentinels (from astype) to None in
+        # a single pass instead of two replace() walks over the column
+        sentinel_mask = result.isin(('', 'nan'))
+        if sentinel_mask.any():
+            result[sentinel_mask] = None
         
         # Convert case
         if convert_case == "lower":
@@ -1,7 +1,87 @@
-# pandas_toolkit/io/exporters.py
+# pandas_toolkit/io/exporter.py
+import os
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv  # noqa: F401
+    _HAS_PYARROW = True
+    # Conversion failures worth falling back on: ArrowNotImplementedError
+    # (e.g. dtypes Arrow can't represent) derives from ArrowException,
+    # not ValueError/TypeError
+    _ARROW_FALLBACK_ERRORS = (ValueError, TypeError, pa.ArrowException)
+except ImportError:
+    _HAS_PYARROW = False
+    _ARROW_FALLBACK_ERRORS = (ValueError, TypeError)
+
+# Extensions pyarrow.CompressedOutputStream can write directly
+_ARROW_CSV_CODECS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".lz4": "lz4"}
+
+
+def _column_cells(series) -> list:
+    """
+    Materialize one column as a list of openpyxl-ready scalars.
+
+    The dtype is inspected once per column instead of once per cell:
+    plain integer and boolean columns convert wholesale, float columns
+    use a vectorized isnan mask, and only object/string columns pay for
+    the generic per-element null check. Nulls become None so they land
+    as empty cells, matching to_excel.
+    """
+    kind = series.dtype.kind
+    values = series.to_numpy()
+
+    if kind in "iub" and values.dtype.kind in "iub":
+        # Non-nullable numpy ints/bools cannot hold missing values
+        return values.tolist()
+
+    if kind == "f" and values.dtype.kind == "f":
+        mask = np.isnan(values)
+        values = values.astype(object)
+        if mask.any():
+            values[mask] = None
+        return values.tolist()
+
+    if values.dtype != object:
+        values = series.to_numpy(dtype=object)
+    else:
+        values = values.copy()
+    mask = pd.isna(values)
+    if mask.any():
+        values[mask] = None
+    return values.tolist()
+
+
+def _write_xlsx_writeonly(filepath, sheets) -> None:
+    """
+    Write sheets to an xlsx file with openpyxl's write-only workbook.
+
+    Module-level (rather than a method) so multi-file exports can hand it
+    to worker processes. See FileExporter._write_excel_writeonly for the
+    rationale and semantics.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    try:
+        for sheet_name, df in sheets:
+            ws = wb.create_sheet(title=sheet_name)
+            ws.append(list(df.columns))
+
+            # Convert column-by-column so dtype dispatch and null
+            # masking happen once per column, not once per cell
+            columns = [_column_cells(df.iloc[:, j]) for j in range(df.shape[1])]
+            for row in zip(*columns):
+                ws.append(row)
+
+        wb.save(filepath)
+    finally:
+        wb.close()
+
+
 class FileExporter:
     """
     Exporter for saving DataFrames to various file formats.
@@ -194,6 +274,24 @@ class FileExporter:
                 f"Supported methods: 'excel', 'csv'"
             )
 
+    def _write_excel_writeonly(self, filepath, sheets) -> None:
+        """
+        Write sheets to an xlsx file with openpyxl's write-only workbook.
+
+        df.to_excel materializes one openpyxl Cell object per value and
+        keeps the whole workbook in memory; the write-only workbook streams
+        rows straight to disk, skipping the per-cell object churn. Output
+        matches to_excel with index=False (NaN becomes an empty cell).
+
+        Parameters
+        ----------
+        filepath : Path
+            Destination .xlsx path.
+        sheets : iterable of (str, pd.DataFrame)
+            Sheet names and their frames, in workbook order.
+        """
+        _write_xlsx_writeonly(filepath, sheets)
+
     def _export_tables_to_excel(
         self,
         tables: list,
@@ -225,7 +323,7 @@ class FileExporter:
             )
         
         try:
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            def iter_sheets():
                 for table_idx, df in enumerate(tables, start=1):
                     # Determine if table needs splitting
                     if len(df) <= max_rows_per_sheet:
@@ -234,29 +332,29 @@ class FileExporter:
                             sheet_name = kwargs.pop("sheet_name", "Sheet1")
                         else:
                             sheet_name = f"Table{table_idx}"
-                        
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        
+
                         if self.verbose:
                             print(
                                 f"[INFO] Created {sheet_name}: {df.shape[0]} rows, "
                                 f"{df.shape[1]} columns"
                             )
+                        yield sheet_name, df
                     else:
                         # Table needs splitting into multiple sheets
-                        num_parts = (len(df) + max_rows_per_sheet - 1) // max_rows_per_sheet
-                        
+                        n_rows = len(df)
+                        num_parts = (n_rows + max_rows_per_sheet - 1) // max_rows_per_sheet
+
                         if self.verbose:
                             print(
-                                f"[INFO] Table {table_idx} has {len(df)} rows, "
+                                f"[INFO] Table {table_idx} has {n_rows} rows, "
                                 f"splitting into {num_parts} sheets"
                             )
-                        
+
                         for part_idx in range(num_parts):
                             start_idx = part_idx * max_rows_per_sheet
-                            end_idx = min((part_idx + 1) * max_rows_per_sheet, len(df))
+                            end_idx = min(start_idx + max_rows_per_sheet, n_rows)
                             part_df = df.iloc[start_idx:end_idx]
-                            
+
                             # Sheet naming strategy
                             if len(tables) == 1:
                                 # Single table split: Sheet1, Sheet2, ...
@@ -264,55 +362,154 @@ class FileExporter:
                             else:
                                 # Multiple tables with splits: Table1_part1, Table1_part2, ...
                                 sheet_name = f"Table{table_idx}_part{part_idx + 1}"
-                            
+
                             # Excel sheet name limit is 31 characters
                             sheet_name = sheet_name[:31]
-                            
-                            part_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                            
+
                             if self.verbose:
                                 print(
                                     f"[INFO] Created {sheet_name}: {part_df.shape[0]} rows"
                                 )
-            
+                            yield sheet_name, part_df
+
+            self._write_excel_writeonly(filepath, iter_sheets())
+
             if self.verbose:
                 print(f"[INFO] Successfully exported to {filepath}")
         
         except Exception as e:
             raise Exception(f"Error exporting tables to Excel {filepath}: {e}") from e
 
-    def _export_csv(self, df: pd.DataFrame, filename: str, **kwargs) -> None:
+    def _export_csv(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        fast: bool = True,
+        compression="infer",
+        **kwargs
+    ) -> None:
         """
         Export DataFrame to a single CSV file.
-        
+
+        Compressed output is selected by extension: name the file
+        data.csv.zst (or .gz, .bz2, ...) and both the pyarrow and pandas
+        paths compress on the fly. For multi-gigabyte exports this
+        halves the bytes written and is usually faster end to end.
+
         Parameters
         ----------
         df : pd.DataFrame
             DataFrame to export.
         filename : str
             Name of the output CSV file.
+        fast : bool, default True
+            Use pyarrow's multithreaded CSV writer when available and no
+            custom to_csv options are given; pass fast=False to force the
+            pandas writer. Frames with datetime or timedelta columns keep
+            the pandas path (pyarrow serializes timestamps differently,
+            e.g. with a fractional-seconds suffix), as do frames with
+            non-Arrow-convertible dtypes. Note the pyarrow writer quotes
+            all headers and string fields where pandas quotes only fields
+            that need it — the data round-trips identically through any
+            CSV reader, but the raw bytes differ; pass fast=False if
+            byte-for-byte to_csv output matters.
+        compression : str or dict, default "infer"
+            Passed to pandas.to_csv(); "infer" picks the codec from the
+            file extension.
         **kwargs : dict
             Additional arguments passed to pandas.to_csv().
-        
+
         Examples
         --------
         >>> exporter.export(df, method="csv", filename="data.csv")
+        >>> exporter.export(df, method="csv", filename="data.csv.zst")
         >>> exporter.export(df, method="csv", filename="data.csv", index=False)
         """
         if not filename:
             raise ValueError("filename is required for CSV export")
-        
+
         filepath = self.output_dir / filename
-        
+
+        if (
+            self.verbose
+            and filepath.suffix.lower() == ".csv"
+            and len(df) > 1_000_000
+        ):
+            print(
+                f"[INFO] Large export ({len(df)} rows): consider a "
+                f"compressed filename like {filename}.zst"
+            )
+
         try:
-            df.to_csv(filepath, index=False, **kwargs)
-            
+            # Custom to_csv options (sep, encoding, float_format, ...)
+            # have no pyarrow equivalent, so they keep the pandas path.
+            # Datetime/timedelta columns also stay on pandas: pyarrow
+            # formats timestamps differently (ISO with fractional seconds)
+            # and the output bytes should not depend on the writer chosen.
+            codec = self._arrow_csv_codec(filepath)
+            if (
+                fast and _HAS_PYARROW and not kwargs and compression == "infer"
+                and codec is not False
+                and not any(dtype.kind in "mM" for dtype in df.dtypes)
+            ):
+                try:
+                    self._write_csv_arrow(df, filepath, codec)
+                except _ARROW_FALLBACK_ERRORS:
+                    df.to_csv(filepath, index=False)
+            else:
+                df.to_csv(filepath, index=False, compression=compression, **kwargs)
+
             if self.verbose:
                 print(f"[INFO] Exported {df.shape[0]} rows to CSV: {filepath}")
-        
+
         except Exception as e:
             raise Exception(f"Error exporting to CSV {filepath}: {e}") from e
 
+    @staticmethod
+    def _arrow_csv_codec(filepath: Path):
+        """
+        Map a file extension to a pyarrow compression codec.
+
+        Returns the codec name for extensions pyarrow can stream
+        (.gz, .bz2, .zst, .lz4), None for uncompressed output, and
+        False for formats only pandas handles (.zip, .xz, tar archives).
+        """
+        name = filepath.name.lower()
+        if name.endswith((".zip", ".xz", ".tar", ".tar.gz", ".tar.bz2")):
+            return False
+        return _ARROW_CSV_CODECS.get(filepath.suffix.lower())
+
+    @staticmethod
+    def _write_csv_arrow(df: pd.DataFrame, filepath: Path, codec=None) -> None:
+        """
+        Write a DataFrame to CSV via pyarrow's multithreaded writer.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame to write.
+        filepath : Path
+            Destination file path.
+        codec : str, optional
+            Compression codec for the output stream (e.g. "zstd").
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # quoting_style='needed' leaves numeric fields unquoted like
+        # pandas does; headers and string fields are still always quoted
+        # by pyarrow, which is the documented format difference of the
+        # fast path (there is no minimal-quoting mode)
+        write_options = pacsv.WriteOptions(
+            include_header=True, quoting_style='needed'
+        )
+        if codec is not None:
+            with pa.CompressedOutputStream(str(filepath), codec) as sink:
+                pacsv.write_csv(table, sink, write_options=write_options)
+        else:
+            pacsv.write_csv(table, str(filepath), write_options=write_options)
+
     def _export_excel(self, df: pd.DataFrame, filename: str, **kwargs) -> None:
         """
         Export DataFrame to a single Excel file (single sheet).
@@ -339,9 +536,13 @@ class FileExporter:
         try:
             # Default sheet name is "Sheet1" if not provided
             sheet_name = kwargs.pop("sheet_name", "Sheet1")
-            
-            df.to_excel(filepath, sheet_name=sheet_name, index=False, **kwargs)
-            
+
+            if kwargs:
+                # Extra to_excel options (header, startrow, ...) need pandas
+                df.to_excel(filepath, sheet_name=sheet_name, index=False, **kwargs)
+            else:
+                self._write_excel_writeonly(filepath, [(sheet_name, df)])
+
             if self.verbose:
                 print(f"[INFO] Exported {df.shape[0]} rows to Excel: {filepath}")
         
@@ -387,36 +588,65 @@ class FileExporter:
         
         try:
             # Split DataFrame into chunks
-            num_parts = (len(df) + max_rows - 1) // max_rows
-            
+            n_rows = len(df)
+            num_parts = (n_rows + max_rows - 1) // max_rows
+
             if self.verbose:
                 print(
                     f"[INFO] Exporting {df.shape[0]} rows into {num_parts} Excel files"
                 )
             
             sheet_name = kwargs.pop("sheet_name", "Sheet1")
-            
+
+            # Each part is an independent file and xlsx serialization is
+            # CPU-bound pure Python, so fan multi-part exports out across
+            # processes. Custom to_excel options keep the serial pandas path.
+            parallel = not kwargs and num_parts >= 2 and (os.cpu_count() or 1) >= 2
+
+            parts = []
             for i in range(num_parts):
                 start_idx = i * max_rows
-                end_idx = min((i + 1) * max_rows, len(df))
+                end_idx = min(start_idx + max_rows, n_rows)
                 part_df = df.iloc[start_idx:end_idx]
-                
+
                 # Create filename with part number (1-indexed)
                 filename = f"{filename_prefix}_part{i + 1}.xlsx"
                 filepath = self.output_dir / filename
-                
-                part_df.to_excel(
-                    filepath, 
-                    sheet_name=sheet_name, 
-                    index=False, 
-                    **kwargs
-                )
-                
-                if self.verbose:
+
+                if parallel:
+                    parts.append((filepath, part_df))
+                elif kwargs:
+                    part_df.to_excel(
+                        filepath,
+                        sheet_name=sheet_name,
+                        index=False,
+                        **kwargs
+                    )
+                else:
+                    self._write_excel_writeonly(filepath, [(sheet_name, part_df)])
+
+                if self.verbose and not parallel:
                     print(
                         f"[INFO] Created part {i + 1}/{num_parts}: "
                         f"{filename} ({part_df.shape[0]} rows)"
                     )
+
+            if parallel:
+                max_workers = min(num_parts, os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _write_xlsx_writeonly, filepath, [(sheet_name, part_df)]
+                        )
+                        for filepath, part_df in parts
+                    ]
+                    for i, future in enumerate(futures):
+                        future.result()
+                        if self.verbose:
+                            print(
+                                f"[INFO] Created part {i + 1}/{num_parts}: "
+                                f"{parts[i][0].name} ({parts[i][1].shape[0]} rows)"
+                            )
         
         except Exception as e:
             raise Exception(f"Error exporting excel_parts: {e}") from e
@@ -463,7 +693,8 @@ class FileExporter:
             filepath = self.output_dir / filename
             
             # Calculate number of sheets needed
-            num_sheets = (len(df) + max_rows - 1) // max_rows
+            n_rows = len(df)
+            num_sheets = (n_rows + max_rows - 1) // max_rows
             
             if self.verbose:
                 print(
@@ -471,23 +702,24 @@ class FileExporter:
                     f"in {filename}"
                 )
             
-            # Use ExcelWriter to write multiple sheets
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            # Stream every sheet through one write-only workbook
+            def iter_sheets():
                 for i in range(num_sheets):
                     start_idx = i * max_rows
-                    end_idx = min((i + 1) * max_rows, len(df))
+                    end_idx = min(start_idx + max_rows, n_rows)
                     sheet_df = df.iloc[start_idx:end_idx]
-                    
+
                     # Sheet names: Sheet1, Sheet2, etc. (Excel limit: 31 chars)
                     sheet_name = f"Sheet{i + 1}"
-                    
-                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
+
                     if self.verbose:
                         print(
                             f"[INFO] Created {sheet_name}: "
                             f"{sheet_df.shape[0]} rows"
                         )
+                    yield sheet_name, sheet_df
+
+            self._write_excel_writeonly(filepath, iter_sheets())
             
             if self.verbose:
                 print(f"[INFO] Successfully exported to {filepath}")
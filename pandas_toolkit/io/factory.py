@@ -1,4 +1,5 @@
-from pathlib import Path
+import os
+import sys
 from pandas_toolkit.io.readers import CSVReader, TSVReader, PipeReader, ExcelReader, JSONReader, HTMLReader
 from pandas_toolkit.io.base import FileReader
 
@@ -20,19 +21,20 @@ class ReaderFactory:
     >>> df = reader.read("data.xlsx")
     """
     
-    # Mapping of file extensions to reader classes
+    # Mapping of file extensions to reader classes. Keys are interned so
+    # repeated lookups hit CPython's identity fast path for dict keys.
     READER_MAP = {
-        ".csv": CSVReader,
-        ".tsv": TSVReader,
-        ".txt": CSVReader,  # Default to CSV for .txt
-        ".dat": CSVReader,  # Default to CSV for .dat
-        ".xlsx": ExcelReader,
-        ".xls": ExcelReader,
-        ".json": JSONReader,
-        ".jsonl": JSONReader,
-        ".pipe": PipeReader,
-        ".html": HTMLReader,
-        ".htm": HTMLReader,
+        sys.intern(".csv"): CSVReader,
+        sys.intern(".tsv"): TSVReader,
+        sys.intern(".txt"): CSVReader,  # Default to CSV for .txt
+        sys.intern(".dat"): CSVReader,  # Default to CSV for .dat
+        sys.intern(".xlsx"): ExcelReader,
+        sys.intern(".xls"): ExcelReader,
+        sys.intern(".json"): JSONReader,
+        sys.intern(".jsonl"): JSONReader,
+        sys.intern(".pipe"): PipeReader,
+        sys.intern(".html"): HTMLReader,
+        sys.intern(".htm"): HTMLReader,
     }
     
     @classmethod
@@ -76,17 +78,20 @@ class ReaderFactory:
         >>> reader = factory.create_reader("report.xlsx")
         >>> df = reader.read("report.xlsx")
         """
-        filepath = Path(filepath)
-        extension = filepath.suffix.lower()
-        
-        if extension not in cls.READER_MAP:
+        # splitext is a single C-level call; Path(filepath).suffix builds
+        # a full Path object just to throw it away
+        extension = os.path.splitext(os.fspath(filepath))[1].lower()
+
+
+        # Single .get() instead of `in` + [] so the hot path hashes once
+        reader_class = cls.READER_MAP.get(extension)
+        if reader_class is None:
             supported = ", ".join(cls.READER_MAP.keys())
             raise ValueError(
                 f"Unsupported file extension: {extension}\n"
                 f"Supported extensions: {supported}"
             )
-        
-        reader_class = cls.READER_MAP[extension]
+
         return reader_class(output_dir=output_dir, verbose=verbose, **kwargs)
     
     @classmethod
@@ -28,7 +28,10 @@ class CSVReader(DelimitedTextReader):
         verbose=False,
         capture_bad_lines=False,
         output_dir=".",
-        exporter: FileExporter = None
+        exporter: FileExporter = None,
+        chunksize=None,
+        large_file_threshold_mb=100,
+        cache_dir=None
     ):
         """
         Initialize the CSV reader.
@@ -47,7 +50,14 @@ class CSVReader(DelimitedTextReader):
             Output directory for exported files.
         exporter : FileExporter, optional
             Custom FileExporter instance. If None, creates one with output_dir.
-        
+        chunksize : int, optional
+            Read files in chunks of this many rows and concatenate.
+        large_file_threshold_mb : int, default 100
+            File size (in MiB) above which chunked reading kicks in
+            automatically. Set to None to disable.
+        cache_dir : str, optional
+            Directory for an on-disk parquet cache of read results.
+
         Examples
         --------
         >>> reader = CSVReader(verbose=True, output_dir="exports")
@@ -59,5 +69,8 @@ class CSVReader(DelimitedTextReader):
             verbose=verbose,
             capture_bad_lines=capture_bad_lines,
             output_dir=output_dir,
-            exporter=exporter or FileExporter(output_dir=output_dir, verbose=verbose)
+            exporter=exporter,
+            chunksize=chunksize,
+            large_file_threshold_mb=large_file_threshold_mb,
+            cache_dir=cache_dir
         )
\ No newline at end of file
@@ -1,4 +1,9 @@
+import copy
+import os
+import threading
+
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pandas_toolkit.io.base import FileReader
 from pandas_toolkit.io.base.constants import EXCEL_ENGINES, EXCEL_ENGINES_BY_FORMAT
@@ -27,7 +32,10 @@ class ExcelReader(FileReader):
     >>> sheets = reader.read_multiple_sheets("data.xlsx")
     >>> print(reader.success_engine)  # Track which engine was used
     """
-    
+
+    #: Supported file extensions (lowercase), shared across instances
+    FILE_EXTENSIONS = frozenset({'.xlsx', '.xls'})
+
     def __init__(
         self,
         output_dir=".",
@@ -64,6 +72,9 @@ class ExcelReader(FileReader):
         
         self.engines = engines or EXCEL_ENGINES
         self.success_engine = None
+        # Engine that last worked per extension, so repeated reads skip
+        # re-trying engines that already failed for that format
+        self._engine_by_extension = {}
 
     def _get_engines_for_file(self, filepath: str) -> list:
         """
@@ -88,27 +99,39 @@ class ExcelReader(FileReader):
         """
         filepath_obj = Path(filepath)
         extension = filepath_obj.suffix.lower()
-        
+
         # Get engines for this file type, or use default
-        return self.engines.get(extension, self.engines.get("default", ["openpyxl"]))
+        engines = list(self.engines.get(extension, self.engines.get("default", ["openpyxl"])))
+
+        # Try the engine that last worked for this extension first
+        cached = self._engine_by_extension.get(extension)
+        if cached is not None and cached in engines and engines[0] != cached:
+            engines.remove(cached)
+            engines.insert(0, cached)
+
+        return engines
 
-    def _read(self, filepath: str, sheet_name=0, **kwargs) -> pd.DataFrame:
+    def _read(self, filepath: str, sheet_name=0, excel_file=None, **kwargs) -> pd.DataFrame:
         """
         Read an Excel file with automatic engine detection and fallback.
-        
+
         This method tries different pandas engines until one successfully
         reads the file. Useful for handling files created with different
         Excel versions or with corrupted formatting.
-        
+
         Parameters
         ----------
         filepath : str
             Path to the Excel file (.xlsx or .xls).
         sheet_name : str or int, default 0
             Name of sheet to read, or 0 for first sheet.
+        excel_file : pd.ExcelFile, optional
+            An already-open workbook handle. When given, the sheet is
+            read from it directly — no re-open, no engine search — which
+            amortizes the zip/workbook parse across many sheet reads.
         **kwargs : dict
             Additional pandas read_excel arguments (header, skiprows, usecols, etc.).
-        
+
         Returns
         -------
         pd.DataFrame
@@ -128,9 +151,14 @@ class ExcelReader(FileReader):
         >>> df = reader.read("data.xlsx", sheet_name=1)  # Second sheet
         >>> print(f"Read with engine: {reader.success_engine}")
         """
+        if excel_file is not None:
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, **kwargs)
+            self.success_engine = excel_file.engine
+            return df
+
         if not Path(filepath).exists():
             raise FileNotFoundError(f"File not found: {filepath}")
-        
+
         engines_to_try = self._get_engines_for_file(filepath)
         last_error = None
         
@@ -151,7 +179,8 @@ class ExcelReader(FileReader):
                 
                 # Success!
                 self.success_engine = engine
-                
+                self._engine_by_extension[Path(filepath).suffix.lower()] = engine
+
                 if self.verbose:
                     print(
                         f"[INFO] Successfully read with engine='{engine}': "
@@ -293,22 +322,105 @@ class ExcelReader(FileReader):
             )
         
         sheets_dict = {}
-        for sheet_name in sheet_names:
+
+        # One workbook handle per worker thread: the zip open and
+        # workbook/shared-strings parse are paid once per thread instead
+        # of once per sheet. Disabled when the parquet cache is active —
+        # a handle object must not leak into the cache key.
+        tls = threading.local()
+        open_handles = []
+        use_handles = self.cache_dir is None
+
+        def read_one(sheet_name):
+            """Read one sheet with a per-worker reader copy.
+
+            Sheet parsing is zip-inflate plus XML work that releases the
+            GIL, so concurrent sheets overlap; the shallow copy keeps
+            per-read state from racing between threads.
+            """
+            reader = copy.copy(self)
+            if not use_handles:
+                return reader.read(filepath, sheet_name=sheet_name, **kwargs)
+            xls = getattr(tls, 'xls', None)
+            if xls is None:
+                xls = self._open_excel_file(filepath)
+                tls.xls = xls
+                open_handles.append(xls)
+            return reader.read(
+                filepath, sheet_name=sheet_name, excel_file=xls, **kwargs
+            )
+
+        max_workers = min(8, os.cpu_count() or 1, max(len(sheet_names), 1))
+
+        if len(sheet_names) < 2 or max_workers < 2:
+            # Not worth spinning up a pool for a single sheet
+            futures = {sheet_name: None for sheet_name in sheet_names}
+            executor = None
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            futures = {
+                sheet_name: executor.submit(read_one, sheet_name)
+                for sheet_name in sheet_names
+            }
+
+        try:
+            for sheet_name, future in futures.items():
+                try:
+                    df = future.result() if future is not None else read_one(sheet_name)
+                    sheets_dict[sheet_name] = df
+
+                    if self.verbose:
+                        print(f"[INFO] Loaded sheet '{sheet_name}': {df.shape}")
+
+                except MemoryError:
+                    raise
+                except Exception as e:
+                    if self.verbose:
+                        print(
+                            f"[WARNING] Failed to read sheet '{sheet_name}': {e}"
+                        )
+                    continue
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            for handle in open_handles:
+                handle.close()
+
+        return sheets_dict
+
+    def _open_excel_file(self, filepath: str) -> pd.ExcelFile:
+        """
+        Open a workbook handle, trying engines in preference order.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the Excel file.
+
+        Returns
+        -------
+        pd.ExcelFile
+            The opened workbook handle; callers own closing it.
+
+        Raises
+        ------
+        Exception
+            If no engine can open the file.
+        """
+        last_error = None
+        for engine in self._get_engines_for_file(filepath):
             try:
-                df = self.read(filepath, sheet_name=sheet_name, **kwargs)
-                sheets_dict[sheet_name] = df
-                
-                if self.verbose:
-                    print(f"[INFO] Loaded sheet '{sheet_name}': {df.shape}")
-            
+                xls = pd.ExcelFile(filepath, engine=engine)
             except Exception as e:
+                last_error = e
                 if self.verbose:
-                    print(
-                        f"[WARNING] Failed to read sheet '{sheet_name}': {e}"
-                    )
+                    print(f"[DEBUG] Engine '{engine}' failed to open: {e}")
                 continue
-        
-        return sheets_dict
+            self._engine_by_extension[Path(filepath).suffix.lower()] = engine
+            return xls
+        raise Exception(
+            f"Could not open Excel file {filepath} with any engine"
+        ) from last_error
 
     def read_all(
         self,
@@ -405,6 +517,6 @@ class ExcelReader(FileReader):
         
         return tables
 
-    def _get_file_extensions(self) -> list:
+    def _get_file_extensions(self) -> frozenset:
         """Get file extensions for Excel files."""
-        return ['.xlsx', '.XLSX', '.xls', '.XLS']
\ No newline at end of file
+        return self.FILE_EXTENSIONS
\ No newline at end of file
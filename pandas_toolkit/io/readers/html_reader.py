@@ -32,7 +32,10 @@ class HTMLReader(FileReader):
     >>> df0 = tables[0]
     >>> df1 = tables[1]
     """
-    
+
+    #: Supported file extensions (lowercase), shared across instances
+    FILE_EXTENSIONS = frozenset({'.html', '.htm'})
+
     def __init__(
         self,
         output_dir=".",
@@ -444,6 +447,6 @@ class HTMLReader(FileReader):
         
         return tables_dict
 
-    def _get_file_extensions(self) -> list:
+    def _get_file_extensions(self) -> frozenset:
         """Get file extensions for HTML files."""
-        return ['.html', '.HTML', '.htm', '.HTM']
+        return self.FILE_EXTENSIONS
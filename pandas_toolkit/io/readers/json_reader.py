@@ -22,7 +22,10 @@ class JSONReader(FileReader):
     >>> df = reader.read("data.jsonl")  # JSON Lines format
     >>> files = reader.read_multiple_files("data_folder/")
     """
-    
+
+    #: Supported file extensions (lowercase), shared across instances
+    FILE_EXTENSIONS = frozenset({'.json', '.jsonl'})
+
     def __init__(
         self,
         output_dir=".",
@@ -125,6 +128,6 @@ class JSONReader(FileReader):
         
         return self.read(filepath, lines=True, **kwargs)
 
-    def _get_file_extensions(self) -> list:
+    def _get_file_extensions(self) -> frozenset:
         """Get file extensions for JSON files."""
-        return ['.json', '.JSON', '.jsonl', '.JSONL']
\ No newline at end of file
+        return self.FILE_EXTENSIONS
\ No newline at end of file
@@ -24,7 +24,10 @@ class PipeReader(DelimitedTextReader):
         verbose=False,
         capture_bad_lines=False,
         output_dir=".",
-        exporter: FileExporter = None
+        exporter: FileExporter = None,
+        chunksize=None,
+        large_file_threshold_mb=100,
+        cache_dir=None
     ):
         """
         Initialize the Pipe reader.
@@ -45,6 +48,13 @@ class PipeReader(DelimitedTextReader):
             Output directory for exported files.
         exporter : FileExporter, optional
             Custom FileExporter instance.
+        chunksize : int, optional
+            Read files in chunks of this many rows and concatenate.
+        large_file_threshold_mb : int, default 100
+            File size (in MiB) above which chunked reading kicks in
+            automatically. Set to None to disable.
+        cache_dir : str, optional
+            Directory for an on-disk parquet cache of read results.
         """
         # Default delimiters: pipe first, then fallback options
         if delimiters is None:
@@ -56,5 +66,8 @@ class PipeReader(DelimitedTextReader):
             verbose=verbose,
             capture_bad_lines=capture_bad_lines,
             output_dir=output_dir,
-            exporter=exporter or FileExporter(output_dir=output_dir, verbose=verbose)
+            exporter=exporter,
+            chunksize=chunksize,
+            large_file_threshold_mb=large_file_threshold_mb,
+            cache_dir=cache_dir
         )
\ No newline at end of file
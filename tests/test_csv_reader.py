@@ -155,6 +155,57 @@ def test_csvreader_encoding_error_no_valid_encoding(tmp_path):
     assert reader.encodings == ["ascii"]
 
 
+def test_csvreader_utf16_bom_roundtrip(tmp_path):
+    """
+    Test reading a UTF-16 file that carries a byte-order mark.
+
+    The BOM identifies the encoding definitively, so the reader should
+    pick a utf-16 encoding first instead of misreading the file as UTF-8.
+
+    Verifies that:
+    - The file is read successfully with the correct shape
+    - Column names and cell values round-trip intact
+    - A utf-16 family encoding is tracked as the successful one
+    """
+    content = "nombre,ciudad\nJosé,Córdoba\nAna,Rosario"
+    p = tmp_path / "utf16_bom.csv"
+    p.write_bytes(content.encode("utf-16"))  # prepends a BOM
+
+    reader = CSVReader()
+    df = reader.read(p)
+
+    assert df.shape == (2, 2)
+    assert list(df.columns) == ["nombre", "ciudad"]
+    assert df.iloc[0]["nombre"] == "José"
+    assert reader.success_encoding.startswith("utf-16")
+
+
+def test_csvreader_utf16_without_bom(tmp_path):
+    """
+    Test reading a UTF-16 file that lacks a byte-order mark.
+
+    Without a BOM, probabilistic detection is the only signal that the
+    file is UTF-16; the reader must not discard the utf-16 candidates
+    before that detection has had a chance to run.
+
+    Verifies that:
+    - The file is not silently misread as UTF-8 (empty/mojibake frame)
+    - Column names and accented values are read correctly
+    - A utf-16 family encoding is tracked as the successful one
+    """
+    content = "nombre,ciudad\nJosé,Córdoba\nAna,Rosario"
+    p = tmp_path / "utf16_no_bom.csv"
+    p.write_bytes(content.encode("utf-16-le"))  # no BOM
+
+    reader = CSVReader()
+    df = reader.read(p)
+
+    assert df.shape == (2, 2)
+    assert list(df.columns) == ["nombre", "ciudad"]
+    assert df.iloc[0]["nombre"] == "José"
+    assert reader.success_encoding.startswith("utf-16")
+
+
 # =====================================================================
 # Test: Delimiter Detection
 # =====================================================================
@@ -290,6 +341,29 @@ def test_csvreader_read_multiple_files_ignores_directories(tmp_path):
     assert "file1" in tables
 
 
+def test_csvreader_read_multiple_files_merges_bad_lines(tmp_path):
+    """
+    Test that bad lines from concurrently read files are all collected.
+
+    Each worker thread captures into its own list so captures for one
+    file can't be wiped by another; the lists are merged back into the
+    parent reader afterwards.
+
+    Verifies that:
+    - Both files are read despite their malformed rows
+    - Bad lines from every file end up in reader.bad_lines
+    """
+    (tmp_path / "first.csv").write_text("a,b\n1,2\n3,4,99")
+    (tmp_path / "second.csv").write_text("a,b\n5,6\n7,8,88")
+
+    reader = CSVReader(capture_bad_lines=True)
+    tables = reader.read_multiple_files(tmp_path)
+
+    assert len(tables) == 2
+    assert any("99" in str(line) for line in reader.bad_lines)
+    assert any("88" in str(line) for line in reader.bad_lines)
+
+
 # =====================================================================
 # Test: Column Normalization
 # =====================================================================
@@ -782,6 +856,61 @@ def test_csvreader_capture_bad_lines(tmp_path):
     assert isinstance(reader.bad_lines, list)
 
 
+def test_csvreader_captured_bad_lines_content(tmp_path):
+    """
+    Test that captured bad lines contain the actual malformed rows.
+
+    The capture pass must hand back the offending lines themselves,
+    not just signal that something was skipped.
+
+    Verifies that:
+    - The row with too many fields is present in bad_lines
+    - Valid rows are not reported as bad
+    """
+    p = tmp_path / "bad_lines_content.csv"
+    p.write_text("a,b,c\n1,2,3\n4,5,6\n7,8,9,10", encoding="utf-8")
+
+    reader = CSVReader(capture_bad_lines=True)
+    df = reader.read(p)
+
+    assert df.shape == (2, 3)
+    assert any("10" in str(line) for line in reader.bad_lines)
+    assert not any("4,5,6" in str(line) for line in reader.bad_lines)
+
+
+# =====================================================================
+# Test: Downcasting
+# =====================================================================
+
+def test_csvreader_read_downcast_dtypes(tmp_path):
+    """
+    Test that read(downcast=True) shrinks column dtypes.
+
+    Small integers should land in a narrow integer dtype, floats in
+    float32, and low-cardinality string columns become categoricals,
+    without changing any values.
+
+    Verifies that:
+    - Integer columns are downcast below 64 bits
+    - Float columns become float32
+    - Repetitive string columns become category dtype
+    - The values survive the conversion unchanged
+    """
+    rows = "\n".join(f"{i % 100},{i / 10},{'yes' if i % 2 else 'no'}" for i in range(50))
+    p = tmp_path / "downcast.csv"
+    p.write_text("small_int,ratio,flag\n" + rows, encoding="utf-8")
+
+    reader = CSVReader()
+    df_plain = reader.read(p)
+    df = reader.read(p, downcast=True)
+
+    assert df["small_int"].dtype.itemsize < 8
+    assert df["ratio"].dtype == "float32"
+    assert isinstance(df["flag"].dtype, pd.CategoricalDtype)
+    assert df["small_int"].tolist() == df_plain["small_int"].tolist()
+    assert df["flag"].tolist() == df_plain["flag"].tolist()
+
+
 def test_csvreader_verbose_output(tmp_csv, capsys):
     """
     Test that verbose mode produces debug output.
@@ -997,3 +1126,75 @@ def test_csvreader_read_all_with_skip_empty_rows(tmp_path):
     # Should have only 2 data rows (empty rows removed)
     assert len(df) == 2
     assert list(df.columns) == ["col1", "col2"]
+
+
+# =====================================================================
+# Test: Streaming normalized chunks
+# =====================================================================
+
+def test_csvreader_iter_normalized_chunks(tmp_path):
+    """
+    Test streaming a file as normalized chunks.
+
+    iter_normalized_chunks() should detect encoding and delimiter once,
+    then yield chunks of at most `chunksize` rows with normalization
+    applied, and the concatenated chunks should cover the whole file.
+
+    Verifies that:
+    - Chunks respect the requested chunk size
+    - Column names are normalized in each chunk
+    - Total row count matches the file
+    - success_encoding / success_delimiter are tracked
+    """
+    p = tmp_path / "stream.csv"
+    rows = "\n".join(f"{i};value {i}" for i in range(10))
+    p.write_text(f"First Name;Last Name\n{rows}", encoding="utf-8")
+
+    reader = CSVReader()
+    chunks = list(reader.iter_normalized_chunks(str(p), chunksize=4))
+
+    assert len(chunks) == 3
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert list(chunks[0].columns)[:2] == ["first_name", "last_name"]
+
+    total = sum(len(chunk) for chunk in chunks)
+    assert total == 10
+
+    assert reader.success_encoding is not None
+    assert reader.success_delimiter == ";"
+
+
+# =====================================================================
+# Test: Parquet result cache
+# =====================================================================
+
+def test_csvreader_cache_dir(tmp_path):
+    """
+    Test the opt-in parquet cache for read results.
+
+    With cache_dir set, the first read should parse the CSV and write a
+    parquet entry; a second read of the unchanged file should return the
+    same data (served from cache). Modifying the file must invalidate
+    the cached entry.
+
+    Verifies that:
+    - A cache file is written after the first read
+    - A second read returns identical data
+    - Changing the source file is picked up (no stale cache hit)
+    """
+    p = tmp_path / "data.csv"
+    p.write_text("a,b\n1,x\n2,y\n", encoding="utf-8")
+    cache = tmp_path / "cache"
+
+    reader = CSVReader(cache_dir=str(cache))
+
+    df1 = reader.read(str(p))
+    assert len(list(cache.glob("*.parquet"))) == 1
+
+    df2 = reader.read(str(p))
+    pd.testing.assert_frame_equal(df1, df2)
+
+    # Modify the file; the cache key changes and new content is returned
+    p.write_text("a,b\n3,z\n", encoding="utf-8")
+    df3 = reader.read(str(p))
+    assert df3["a"].tolist() == [3]
@@ -213,6 +213,22 @@ def test_skip_trailing_empty_rows_with_strings():
     assert result.iloc[-1]['A'] == 'Jane'
 
 
+def test_skip_trailing_empty_rows_duplicate_columns():
+    """
+    Test trailing empty rows removal with duplicate column labels.
+
+    Frames read with header=None or from messy sources can carry the
+    same label twice; the mask must be computed positionally.
+    """
+    df = pd.DataFrame([['John', '30'], ['Jane', '25'], ['', '  ']])
+    df.columns = ['A', 'A']
+
+    result = FileReader.skip_trailing_empty_rows(df)
+
+    assert result.shape == (2, 2)
+    assert result.iloc[-1, 0] == 'Jane'
+
+
 def test_skip_trailing_empty_rows_empty_dataframe():
     """
     Test with completely empty DataFrame.
@@ -292,10 +308,25 @@ def test_detect_header_row_sparse():
     })
     
     header_row = FileReader.detect_header_row(df, max_rows_to_check=4)
-    
+
     assert header_row == 2
 
 
+def test_detect_header_row_duplicate_columns():
+    """
+    Test header detection on a frame with duplicate column labels.
+
+    Raw frames read with header=None can end up with repeated labels;
+    the filled-cell count must be computed positionally.
+    """
+    df = pd.DataFrame([[None, None], ['Name', 'Age'], ['John', '30']])
+    df.columns = ['A', 'A']
+
+    header_row = FileReader.detect_header_row(df)
+
+    assert header_row == 1
+
+
 # =====================================================================
 # Test: Integration with CSV Reader
 # =====================================================================
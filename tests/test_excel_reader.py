@@ -323,6 +323,35 @@ def test_excel_reader_read_specific_sheets(tmp_excel_multiple_sheets):
     assert "Inventory" not in sheets
 
 
+def test_excel_reader_multiple_sheets_keys_and_order(tmp_path):
+    """
+    Test that concurrent sheet reading preserves keys and workbook order.
+
+    Sheets are read on a thread pool, so completion order is arbitrary;
+    the returned dictionary must still map each sheet name to that
+    sheet's data, in the workbook's sheet order.
+
+    Verifies that:
+    - Dictionary keys appear in workbook sheet order
+    - Each DataFrame holds the data of its own sheet, not a sibling's
+    """
+    p = tmp_path / "many_sheets.xlsx"
+    sheet_names = [f"Sheet_{i:02d}" for i in range(8)]
+    with pd.ExcelWriter(p) as writer:
+        for i, name in enumerate(sheet_names):
+            pd.DataFrame({"sheet_id": [i] * 3, "value": range(i, i + 3)}).to_excel(
+                writer, sheet_name=name, index=False
+            )
+
+    reader = ExcelReader()
+    sheets = reader.read_multiple_sheets(p)
+
+    assert list(sheets.keys()) == sheet_names
+    for i, name in enumerate(sheet_names):
+        assert sheets[name]["sheet_id"].tolist() == [i] * 3
+        assert sheets[name]["value"].tolist() == [i, i + 1, i + 2]
+
+
 # =====================================================================
 # Test: Excel with Normalization
 # =====================================================================
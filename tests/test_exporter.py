@@ -303,6 +303,65 @@ class TestExportTablesEdgeCases(TestFileExporter):
             assert len(sheet_name) <= 31
 
 
+class TestExportCSVFastPath(TestFileExporter):
+    """Tests for the pyarrow CSV fast path and its pandas fallbacks"""
+
+    def test_fast_path_roundtrips_and_quotes_strings(self, exporter, sample_df, tmp_path):
+        """The pyarrow writer quotes headers/strings but data round-trips equal"""
+        exporter.export(sample_df, method="csv", filename="fast.csv")
+
+        filepath = tmp_path / "fast.csv"
+        text = filepath.read_text()
+
+        # Documented fast-path format: headers and string fields quoted,
+        # numeric fields left bare
+        assert text.splitlines()[0] == '"id","name","value"'
+        assert '1,"Alice",100' in text
+
+        df_read = pd.read_csv(filepath)
+        pd.testing.assert_frame_equal(df_read, sample_df)
+
+    def test_datetime_frames_match_pandas_output(self, exporter, tmp_path):
+        """Frames with datetime columns keep pandas' exact to_csv bytes"""
+        df = pd.DataFrame({
+            'id': [1, 2],
+            'when': pd.to_datetime(['2024-01-01 10:00:00', '2024-06-01 12:30:00'])
+        })
+        exporter.export(df, method="csv", filename="dates.csv")
+
+        filepath = tmp_path / "dates.csv"
+        assert filepath.read_text() == df.to_csv(index=False)
+        # No pyarrow-style fractional-seconds suffix
+        assert ".000000" not in filepath.read_text()
+
+    def test_fast_false_matches_pandas_output(self, exporter, sample_df, tmp_path):
+        """fast=False forces the pandas writer byte for byte"""
+        exporter.export(sample_df, method="csv", filename="slow.csv", fast=False)
+
+        filepath = tmp_path / "slow.csv"
+        assert filepath.read_text() == sample_df.to_csv(index=False)
+
+    def test_non_arrow_dtypes_fall_back_to_pandas(self, exporter, tmp_path):
+        """Dtypes Arrow can't convert fall back to the pandas writer"""
+        df = pd.DataFrame({'id': [1, 2], 'z': [1 + 2j, 3 - 4j]})
+        exporter.export(df, method="csv", filename="complex.csv")
+
+        filepath = tmp_path / "complex.csv"
+        assert filepath.read_text() == df.to_csv(index=False)
+
+    def test_export_csv_gz_roundtrip(self, exporter, sample_df, tmp_path):
+        """A .csv.gz filename produces gzip output that reads back equal"""
+        exporter.export(sample_df, method="csv", filename="compressed.csv.gz")
+
+        filepath = tmp_path / "compressed.csv.gz"
+        assert filepath.exists()
+        # gzip magic bytes: the file must actually be compressed
+        assert filepath.read_bytes()[:2] == b"\x1f\x8b"
+
+        df_read = pd.read_csv(filepath)
+        pd.testing.assert_frame_equal(df_read, sample_df)
+
+
 class TestExportTablesIntegration(TestFileExporter):
     """Integration tests combining read_all() and export_tables()"""
     